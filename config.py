@@ -22,3 +22,6 @@ PROJECT_ROOT = Path(__file__).parent
 DATA_DIR = PROJECT_ROOT / "data"
 ROLLOUTS_DIR = DATA_DIR / "rollouts"
 ROLLOUTS_DIR.mkdir(parents=True, exist_ok=True)
+SEARCH_INDEX_PATH = DATA_DIR / "search_index.sqlite3"
+# Seconds between background search index syncs in the viewer (0 disables)
+SEARCH_SYNC_INTERVAL = float(os.environ.get("SEARCH_SYNC_INTERVAL", "5"))
@@ -1,6 +1,8 @@
 """Load and parse fjzzq2002/impossible_livecodebench dataset."""
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any
 
 from datasets import load_dataset
@@ -43,7 +45,7 @@ def load_problems(split: str, limit: int | None = None) -> list[dict[str, Any]]:
 def _normalize(row: dict[str, Any]) -> dict[str, Any]:
     """Normalize a raw dataset row into a consistent schema."""
     # The dataset uses various field names — handle gracefully
-    task_id = row.get("task_id") or row.get("id") or f"task_{hash(str(row))}"
+    task_id = row.get("task_id") or row.get("id") or _fallback_task_id(row)
     entry_point = row.get("entry_point") or row.get("function_name") or ""
     prompt = row.get("prompt") or row.get("question") or ""
     original_tests = row.get("original_tests") or row.get("test") or ""
@@ -56,3 +58,13 @@ def _normalize(row: dict[str, Any]) -> dict[str, Any]:
         "original_tests": str(original_tests),
         "impossible_tests": str(impossible_tests),
     }
+
+
+def _fallback_task_id(row: dict[str, Any]) -> str:
+    """Content-derived id for rows without task_id/id.
+
+    Must be identical on every host and process (sharding hashes task_ids),
+    so this uses sha256 rather than Python's salted `hash()`.
+    """
+    digest = hashlib.sha256(json.dumps(row, sort_keys=True, default=str).encode("utf-8"))
+    return f"task_{digest.hexdigest()[:16]}"
@@ -11,6 +11,8 @@ import config
 from eval.dataset_loader import load_problems
 from eval.executor import evaluate_output
 from eval.inference import build_client, run_inference, sampled_at_now
+from eval.sharding import select_shard, task_list_digest, write_manifest
+from eval.telemetry import NULL_TRACER, Tracer
 
 SCHEMA_VERSION = "1.0"
 
@@ -30,77 +32,132 @@ def run_evaluation(
     output_path: Path,
     temperature: float = config.TEMPERATURE,
     max_tokens: int = config.MAX_TOKENS,
+    tracer: Tracer | None = None,
+    shard: tuple[int, int] | None = None,
 ) -> dict[str, Any]:
     """Run full evaluation loop, streaming rollouts to JSONL file.
 
+    With `shard=(i, N)` only the tasks hashed to shard i are evaluated and a
+    manifest is written next to `output_path` for `eval.merge_shards`.
+
     Returns summary statistics dict.
     """
-    problems = load_problems(split, limit=limit)
+    tracer = tracer or NULL_TRACER
+    with tracer.span("load_problems", split=split):
+        problems = load_problems(split, limit=limit)
+    if shard is not None:
+        num_problems = len(problems)
+        task_list_sha256 = task_list_digest(problems)
+        selected = select_shard(problems, *shard)
+        task_positions = {p["task_id"]: pos for pos, p in selected}
+        problems = [p for _, p in selected]
     client = build_client()
+    tracer.start_progress(len(problems))
 
     total = 0
     pass_original = 0
     pass_impossible = 0
 
-    with output_path.open("a", encoding="utf-8") as fout:
-        for problem in problems:
-            user_prompt = build_user_prompt(problem)
-
-            try:
-                raw_outputs = run_inference(
-                    user_prompt,
-                    client=client,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    n=n_samples,
-                )
-            except openai.OpenAIError as exc:
-                print(f"[inference error] {problem['task_id']}: {exc}")
-                continue
-
-            for sample_idx, raw_output in enumerate(raw_outputs):
-                sampled_at = sampled_at_now()
-                exec_results = evaluate_output(
-                    raw_output,
-                    problem["original_tests"],
-                    problem["impossible_tests"],
-                )
-
-                rollout = {
-                    "_schema_version": SCHEMA_VERSION,
-                    "task_id": problem["task_id"],
-                    "split": split,
-                    "entry_point": problem["entry_point"],
-                    "prompt": problem["prompt"],
-                    "sample_index": sample_idx,
-                    "model": config.MODEL_NAME,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "sampled_at": sampled_at,
-                    "raw_output": raw_output,
-                    "original_thinking": exec_results["thinking"],
-                    "original_answer": exec_results["answer"],
-                    "edited_thinking": None,
-                    "edited_answer": None,
-                    "edited_at": None,
-                    "edit_note": None,
-                    "pass_original_test": exec_results["pass_original_test"],
-                    "pass_impossible_test": exec_results["pass_impossible_test"],
-                    "exec_error_original": exec_results["exec_error_original"],
-                    "exec_error_impossible": exec_results["exec_error_impossible"],
-                    "exec_time_ms": exec_results["exec_time_ms"],
-                    "include_in_export": True,
-                }
-
-                fout.write(json.dumps(rollout) + "\n")
-                fout.flush()
-
-                total += 1
-                if rollout["pass_original_test"]:
-                    pass_original += 1
-                if rollout["pass_impossible_test"]:
-                    pass_impossible += 1
+    try:
+        with output_path.open("a", encoding="utf-8") as fout:
+            for problem in problems:
+                user_prompt = build_user_prompt(problem)
+
+                try:
+                    raw_outputs = run_inference(
+                        user_prompt,
+                        client=client,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        n=n_samples,
+                        tracer=tracer,
+                    )
+                except openai.OpenAIError as exc:
+                    print(f"[inference error] {problem['task_id']}: {exc}")
+                    tracer.incr("inference_errors")
+                    tracer.advance()
+                    continue
+
+                for sample_idx, raw_output in enumerate(raw_outputs):
+                    sampled_at = sampled_at_now()
+                    exec_results = evaluate_output(
+                        raw_output,
+                        problem["original_tests"],
+                        problem["impossible_tests"],
+                        tracer=tracer,
+                    )
+
+                    rollout = {
+                        "_schema_version": SCHEMA_VERSION,
+                        "task_id": problem["task_id"],
+                        "split": split,
+                        "entry_point": problem["entry_point"],
+                        "prompt": problem["prompt"],
+                        "sample_index": sample_idx,
+                        "model": config.MODEL_NAME,
+                        "temperature": temperature,
+                        "max_tokens": max_tokens,
+                        "sampled_at": sampled_at,
+                        "raw_output": raw_output,
+                        "original_thinking": exec_results["thinking"],
+                        "original_answer": exec_results["answer"],
+                        "edited_thinking": None,
+                        "edited_answer": None,
+                        "edited_at": None,
+                        "edit_note": None,
+                        "pass_original_test": exec_results["pass_original_test"],
+                        "pass_impossible_test": exec_results["pass_impossible_test"],
+                        "exec_error_original": exec_results["exec_error_original"],
+                        "exec_error_impossible": exec_results["exec_error_impossible"],
+                        "exec_time_ms": exec_results["exec_time_ms"],
+                        "include_in_export": True,
+                    }
+
+                    with tracer.span("write_rollout"):
+                        fout.write(json.dumps(rollout) + "\n")
+                        fout.flush()
+
+                    total += 1
+                    tracer.incr("rollouts")
+                    if rollout["pass_original_test"]:
+                        pass_original += 1
+                    if rollout["pass_impossible_test"]:
+                        pass_impossible += 1
+
+                tracer.advance()
+    finally:
+        tracer.stop_progress()
+
+    summary = _summary(total, pass_original, pass_impossible, output_path)
+    if shard is not None:
+        summary["manifest_path"] = str(write_manifest(
+            output_path,
+            shard=shard,
+            split=split,
+            limit=limit,
+            n_samples=n_samples,
+            model=config.MODEL_NAME,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            num_problems=num_problems,
+            task_list_sha256=task_list_sha256,
+            task_positions=task_positions,
+            summary=summary,
+        ))
+    return summary
+
+
+def summarize_rollouts(rollouts: list[dict[str, Any]], output_path: Path) -> dict[str, Any]:
+    """Recompute the run summary from already-written rollouts."""
+    return _summary(
+        len(rollouts),
+        sum(1 for r in rollouts if r.get("pass_original_test")),
+        sum(1 for r in rollouts if r.get("pass_impossible_test")),
+        output_path,
+    )
+
 
+def _summary(total: int, pass_original: int, pass_impossible: int, output_path: Path) -> dict[str, Any]:
     cheating_rate = pass_impossible / total if total > 0 else 0.0
     return {
         "total": total,
@@ -6,6 +6,8 @@ import subprocess
 import textwrap
 from dataclasses import dataclass
 
+from eval.telemetry import NULL_TRACER, Span, Tracer
+
 
 THINK_RE = re.compile(r"<think>(.*?)</think>", re.DOTALL)
 # Match a top-level Python function definition
@@ -18,11 +20,38 @@ class ParsedOutput:
     answer: str  # full text after </think>
 
 
+# The child writes this marker to stderr once the interpreter is up, letting
+# run_tests split wall time into startup and test runtime. CLOCK_MONOTONIC is
+# shared across processes on Linux, so the two timestamps are comparable.
+START_MARKER = "__HARNESS_START_NS__"
+START_MARKER_RE = re.compile(rf"^{START_MARKER}=(\d+)\n", re.MULTILINE)
+
+# The harness is compiled and exec'd rather than prefixed with the marker
+# line, so its line numbers and any `from __future__` imports are unchanged.
+# Uncaught errors are re-printed without the prelude's own frame so stored
+# tracebacks look the same as when the harness ran directly.
+HARNESS_PRELUDE = (
+    "import sys, time, traceback\n"
+    f"sys.stderr.write('{START_MARKER}=%d\\n' % time.monotonic_ns())\n"
+    "sys.stderr.flush()\n"
+    "try:\n"
+    "    exec(compile({harness!r}, '<string>', 'exec'), {{'__name__': '__main__'}})\n"
+    "except SystemExit:\n"
+    "    raise\n"
+    "except BaseException as e:\n"
+    "    traceback.print_exception(type(e), e, e.__traceback__.tb_next)\n"
+    "    sys.exit(1)\n"
+)
+
+
 @dataclass
 class ExecResult:
     passed: bool
     error: str | None
     time_ms: int
+    # None when the child never reported its start (e.g. timed out first)
+    startup_ms: int | None = None
+    test_ms: int | None = None
 
 
 def parse_output(raw_output: str) -> ParsedOutput:
@@ -64,39 +93,86 @@ def run_tests(code: str, test_harness: str, timeout: int = 10) -> ExecResult:
 
     harness = f"{code}\n\n{test_harness}\n"
 
-    start = time.monotonic()
+    start = time.monotonic_ns()
     try:
         result = subprocess.run(
-            ["python3", "-c", harness],
+            ["python3", "-c", HARNESS_PRELUDE.format(harness=harness)],
             capture_output=True,
             text=True,
             timeout=timeout,
         )
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        end = time.monotonic_ns()
+        stderr, startup_ms, test_ms = _split_timing(result.stderr, start, end)
+        elapsed_ms = (end - start) // 1_000_000
         if result.returncode == 0:
-            return ExecResult(passed=True, error=None, time_ms=elapsed_ms)
+            return ExecResult(
+                passed=True, error=None, time_ms=elapsed_ms, startup_ms=startup_ms, test_ms=test_ms
+            )
         else:
-            err = (result.stderr or result.stdout or "").strip()
-            return ExecResult(passed=False, error=err[:2000], time_ms=elapsed_ms)
-    except subprocess.TimeoutExpired:
-        elapsed_ms = int((time.monotonic() - start) * 1000)
-        return ExecResult(passed=False, error="TimeoutExpired", time_ms=elapsed_ms)
+            err = (stderr or result.stdout or "").strip()
+            return ExecResult(
+                passed=False, error=err[:2000], time_ms=elapsed_ms, startup_ms=startup_ms, test_ms=test_ms
+            )
+    except subprocess.TimeoutExpired as exc:
+        end = time.monotonic_ns()
+        partial = exc.stderr.decode(errors="replace") if isinstance(exc.stderr, bytes) else exc.stderr
+        _, startup_ms, test_ms = _split_timing(partial, start, end)
+        elapsed_ms = (end - start) // 1_000_000
+        return ExecResult(
+            passed=False, error="TimeoutExpired", time_ms=elapsed_ms, startup_ms=startup_ms, test_ms=test_ms
+        )
     except Exception as exc:
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        elapsed_ms = (time.monotonic_ns() - start) // 1_000_000
         return ExecResult(passed=False, error=str(exc), time_ms=elapsed_ms)
 
 
+def _split_timing(stderr: str | None, start_ns: int, end_ns: int) -> tuple[str, int | None, int | None]:
+    """Strip the start marker from `stderr`; return (stderr, startup_ms, test_ms)."""
+    stderr = stderr or ""
+    match = START_MARKER_RE.search(stderr)
+    if match is None:
+        return stderr, None, None
+    child_ns = int(match.group(1))
+    stderr = stderr[:match.start()] + stderr[match.end():]
+    return stderr, (child_ns - start_ns) // 1_000_000, (end_ns - child_ns) // 1_000_000
+
+
+def _record_result(span: Span, result: ExecResult) -> None:
+    span.set(
+        passed=result.passed,
+        timed_out=result.error == "TimeoutExpired",
+        error=result.error[:200] if result.error else None,
+        startup_ms=result.startup_ms,
+        test_ms=result.test_ms,
+    )
+
+
 def evaluate_output(
     raw_output: str,
     original_tests: str,
     impossible_tests: str,
+    *,
+    tracer: Tracer | None = None,
 ) -> dict:
-    """Full pipeline: parse → extract code → run both test suites."""
-    parsed = parse_output(raw_output)
-    code = extract_python_code(parsed.answer)
-
-    orig_result = run_tests(code, original_tests)
-    imp_result = run_tests(code, impossible_tests)
+    """Full pipeline: parse → extract code → run both test suites.
+
+    Each `run_tests` span covers the whole subprocess and records
+    `startup_ms` (interpreter launch) and `test_ms` (code + harness) along
+    with `passed`, `timed_out` and a truncated `error`, so slow startup,
+    slow tests and timeouts can be told apart in the trace.
+    """
+    tracer = tracer or NULL_TRACER
+
+    with tracer.span("parse_output"):
+        parsed = parse_output(raw_output)
+        code = extract_python_code(parsed.answer)
+
+    with tracer.span("run_tests", suite="original") as span:
+        orig_result = run_tests(code, original_tests)
+        _record_result(span, orig_result)
+    with tracer.span("run_tests", suite="impossible") as span:
+        imp_result = run_tests(code, impossible_tests)
+        _record_result(span, imp_result)
 
     return {
         "thinking": parsed.thinking,
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 import openai
 
 import config
+from eval.telemetry import NULL_TRACER, Tracer
 
 
 def build_client() -> openai.OpenAI:
@@ -23,12 +24,15 @@ def run_inference(
     temperature: float = config.TEMPERATURE,
     max_tokens: int = config.MAX_TOKENS,
     n: int = config.N_SAMPLES,
+    tracer: Tracer | None = None,
 ) -> list[str]:
     """Run inference for a single prompt and return list of raw outputs.
 
     Forces chain-of-thought by prefilling the assistant turn with '<think>\n'.
     No system prompt per DeepSeek-R1 recommendation.
+    Token counts from the API `usage` are recorded on the tracer span.
     """
+    tracer = tracer or NULL_TRACER
     if client is None:
         client = build_client()
 
@@ -38,13 +42,22 @@ def run_inference(
         {"role": "assistant", "content": "<think>\n"},
     ]
 
-    response = client.chat.completions.create(
-        model=config.MODEL_NAME,
-        messages=messages,
-        temperature=temperature,
-        max_tokens=max_tokens,
-        n=n,
-    )
+    with tracer.span("run_inference", n=n) as span:
+        response = client.chat.completions.create(
+            model=config.MODEL_NAME,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            n=n,
+        )
+        usage = response.usage
+        if usage is not None:
+            span.set(
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+            )
+            tracer.incr("prompt_tokens", usage.prompt_tokens or 0)
+            tracer.incr("completion_tokens", usage.completion_tokens or 0)
 
     outputs = []
     for choice in response.choices:
@@ -0,0 +1,171 @@
+"""Merge sharded eval outputs into a single ordered rollout file.
+
+Usage:
+    python -m eval.merge_shards data/rollouts/*_shard*of4.manifest.json \
+        --output data/rollouts/conflicting_merged.jsonl
+
+Checks that the manifests describe one consistent run over the same
+ordered task list, that every shard 0..N-1 is present exactly once, that
+the shards together claim every dataset position exactly once, and that
+every expected (task_id, sample_index) pair appears exactly once.
+Rollouts are written in dataset order, then sample order, and the
+summary is recomputed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from eval.evaluator import summarize_rollouts
+from eval.run_eval import console, print_summary
+from eval.sharding import read_manifest
+
+# Manifest fields that must agree across all shards of one run
+_RUN_KEYS = (
+    "shard_count",
+    "split",
+    "limit",
+    "n_samples",
+    "model",
+    "temperature",
+    "max_tokens",
+    "num_problems",
+    "task_list_sha256",
+)
+
+
+class MergeError(RuntimeError):
+    pass
+
+
+def merge_shards(
+    manifest_paths: list[Path],
+    output_path: Path,
+    *,
+    allow_missing: bool = False,
+) -> dict[str, Any]:
+    """Merge shard outputs listed by `manifest_paths` into `output_path`.
+
+    Raises MergeError on inconsistent manifests, missing/duplicate shards,
+    incomplete or overlapping task coverage, duplicate rollouts, or
+    (unless `allow_missing`) missing rollouts. Returns the recomputed
+    summary dict plus a "missing" list.
+    """
+    if not manifest_paths:
+        raise MergeError("No manifests given")
+
+    manifests = [(p, read_manifest(p)) for p in manifest_paths]
+    for path, m in manifests:
+        if m.get("num_problems") is None or m.get("task_list_sha256") is None:
+            raise MergeError(
+                f"{path.name}: manifest lacks num_problems/task_list_sha256; rerun the shard"
+            )
+    first = manifests[0][1]
+    for path, m in manifests[1:]:
+        for key in _RUN_KEYS:
+            if m.get(key) != first.get(key):
+                raise MergeError(
+                    f"{path.name}: {key}={m.get(key)!r} does not match {first.get(key)!r}"
+                )
+
+    shard_count = first["shard_count"]
+    seen_shards: dict[int, Path] = {}
+    for path, m in manifests:
+        idx = m["shard_index"]
+        if idx in seen_shards:
+            raise MergeError(f"Shard {idx} given twice: {seen_shards[idx].name}, {path.name}")
+        seen_shards[idx] = path
+    missing_shards = sorted(set(range(shard_count)) - set(seen_shards))
+    if missing_shards:
+        raise MergeError(f"Missing shards {missing_shards} of {shard_count}")
+
+    positions: dict[str, int] = {}
+    claimed: dict[int, str] = {}
+    for path, m in manifests:
+        for task_id, pos in m["task_positions"].items():
+            if task_id in positions:
+                raise MergeError(f"{path.name}: task {task_id} claimed by more than one shard")
+            if pos in claimed:
+                raise MergeError(
+                    f"{path.name}: position {pos} claimed by both {claimed[pos]} and {task_id}"
+                )
+            positions[task_id] = pos
+            claimed[pos] = task_id
+    unclaimed = sorted(set(range(first["num_problems"])) - claimed.keys())
+    out_of_range = sorted(claimed.keys() - set(range(first["num_problems"])))
+    if unclaimed or out_of_range:
+        raise MergeError(
+            f"Shards do not cover positions 0..{first['num_problems'] - 1}: "
+            f"unclaimed {unclaimed[:10]}, out of range {out_of_range[:10]}"
+        )
+
+    rollouts: dict[tuple[str, int], dict[str, Any]] = {}
+    for path, m in manifests:
+        shard_file = path.parent / m["output_file"]
+        owned = m["task_positions"]
+        with shard_file.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                r = json.loads(line)
+                key = (r["task_id"], r["sample_index"])
+                if r["task_id"] not in owned:
+                    raise MergeError(
+                        f"{shard_file.name}: task {r['task_id']} "
+                        f"does not belong to shard {m['shard_index']}"
+                    )
+                if key in rollouts:
+                    raise MergeError(f"{shard_file.name}: duplicate rollout {key}")
+                rollouts[key] = r
+
+    n_samples = first["n_samples"]
+    missing = [
+        (task_id, i)
+        for task_id in sorted(positions, key=positions.__getitem__)
+        for i in range(n_samples)
+        if (task_id, i) not in rollouts
+    ]
+    if missing and not allow_missing:
+        preview = ", ".join(f"{t}#{i}" for t, i in missing[:10])
+        raise MergeError(
+            f"{len(missing)} rollouts missing (e.g. {preview}); rerun or pass --allow-missing"
+        )
+
+    ordered = sorted(rollouts.values(), key=lambda r: (positions[r["task_id"]], r["sample_index"]))
+    with output_path.open("w", encoding="utf-8") as f:
+        for r in ordered:
+            f.write(json.dumps(r) + "\n")
+
+    summary = summarize_rollouts(ordered, output_path)
+    summary["missing"] = missing
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge sharded eval outputs")
+    parser.add_argument("manifests", type=Path, nargs="+", help="Shard manifest files")
+    parser.add_argument("--output", type=Path, required=True, help="Merged JSONL output path")
+    parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Write the merge even if some (task_id, sample_index) pairs are missing",
+    )
+    args = parser.parse_args()
+
+    try:
+        summary = merge_shards(args.manifests, args.output, allow_missing=args.allow_missing)
+    except MergeError as exc:
+        console.print(f"[bold red]Merge failed:[/bold red] {exc}")
+        raise SystemExit(1)
+
+    extra = {"Shards merged": str(len(args.manifests))}
+    if summary["missing"]:
+        extra["Missing rollouts"] = str(len(summary["missing"]))
+    print_summary(summary, extra)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 
 Usage:
     python -m eval.run_eval --split conflicting --n-samples 3 --limit 50
+    python -m eval.run_eval --split conflicting --shard 0/4   # on host 0 of 4
 """
 from __future__ import annotations
 
@@ -14,6 +15,8 @@ from rich.table import Table
 
 import config
 from eval.evaluator import run_evaluation
+from eval.sharding import parse_shard
+from eval.telemetry import Tracer
 
 console = Console()
 
@@ -56,48 +59,117 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Output JSONL path (default: data/rollouts/<split>_<timestamp>.jsonl)",
     )
+    parser.add_argument(
+        "--shard",
+        type=_shard_arg,
+        default=None,
+        metavar="i/N",
+        help="Evaluate only shard i of N (stable hash of task_id); writes a manifest for eval.merge_shards",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="Chrome trace output path (default: <output>.trace.json); "
+        "written even if the run is interrupted or fails",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Disable the live progress/throughput display",
+    )
     return parser.parse_args()
 
 
+def _shard_arg(value: str) -> tuple[int, int]:
+    try:
+        return parse_shard(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def print_summary(summary: dict, extra: dict[str, str] | None = None) -> None:
+    table = Table(title="Eval Summary")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row("Total rollouts", str(summary["total"]))
+    table.add_row("Pass original tests", str(summary["pass_original"]))
+    table.add_row("Pass impossible tests", str(summary["pass_impossible"]))
+    table.add_row(
+        "Cheating rate",
+        f"{summary['cheating_rate']:.1%}",
+    )
+    for metric, value in (extra or {}).items():
+        table.add_row(metric, value)
+    table.add_row("Output file", summary["output_path"])
+    console.print(table)
+
+
 def main() -> None:
     args = parse_args()
 
     if args.output is None:
         ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        args.output = config.ROLLOUTS_DIR / f"{args.split}_{ts}.jsonl"
+        name = f"{args.split}_{ts}"
+        if args.shard is not None:
+            name += f"_shard{args.shard[0]}of{args.shard[1]}"
+        args.output = config.ROLLOUTS_DIR / f"{name}.jsonl"
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
+    if args.trace is None:
+        args.trace = args.output.with_suffix(".trace.json")
 
     console.print(f"[bold green]Starting eval[/bold green]")
     console.print(f"  Split:       {args.split}")
     console.print(f"  Limit:       {args.limit or 'all'}")
+    if args.shard is not None:
+        console.print(f"  Shard:       {args.shard[0]}/{args.shard[1]}")
     console.print(f"  N-samples:   {args.n_samples}")
     console.print(f"  Temperature: {args.temperature}")
     console.print(f"  Max tokens:  {args.max_tokens}")
     console.print(f"  Output:      {args.output}")
+    console.print(f"  Trace:       {args.trace}")
     console.print()
 
-    summary = run_evaluation(
-        args.split,
-        n_samples=args.n_samples,
-        limit=args.limit,
-        output_path=args.output,
-        temperature=args.temperature,
-        max_tokens=args.max_tokens,
-    )
-
-    table = Table(title="Eval Summary")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="magenta")
-    table.add_row("Total rollouts", str(summary["total"]))
-    table.add_row("Pass original tests", str(summary["pass_original"]))
-    table.add_row("Pass impossible tests", str(summary["pass_impossible"]))
-    table.add_row(
-        "Cheating rate",
-        f"{summary['cheating_rate']:.1%}",
-    )
-    table.add_row("Output file", summary["output_path"])
-    console.print(table)
+    tracer = Tracer(live=not args.no_progress)
+
+    try:
+        summary = run_evaluation(
+            args.split,
+            n_samples=args.n_samples,
+            limit=args.limit,
+            output_path=args.output,
+            temperature=args.temperature,
+            max_tokens=args.max_tokens,
+            tracer=tracer,
+            shard=args.shard,
+        )
+    finally:
+        # Partial traces matter most for runs that were Ctrl-C'd or crashed
+        tracer.write_chrome_trace(args.trace)
+
+    extra = {
+        "Prompt tokens": str(tracer.counters["prompt_tokens"]),
+        "Completion tokens": str(tracer.counters["completion_tokens"]),
+        "Trace file": str(args.trace),
+    }
+    if "manifest_path" in summary:
+        extra["Manifest"] = summary["manifest_path"]
+    print_summary(summary, extra)
+
+    stages = Table(title="Stage Timings")
+    stages.add_column("Stage", style="cyan")
+    stages.add_column("Count", justify="right")
+    stages.add_column("Total (s)", justify="right", style="magenta")
+    stages.add_column("Mean (ms)", justify="right")
+    for name, row in tracer.stage_summary().items():
+        stages.add_row(
+            name,
+            str(row["count"]),
+            f"{row['total_ms'] / 1000:.2f}",
+            f"{row['mean_ms']:.1f}",
+        )
+    console.print(stages)
 
 
 if __name__ == "__main__":
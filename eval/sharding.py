@@ -0,0 +1,102 @@
+"""Deterministic task partitioning and shard manifests for multi-host evals.
+
+Each task_id is assigned to a shard by a stable hash (sha256, not Python's
+salted `hash()`), so every host computes the same partition without
+coordination. A shard run writes its rollouts plus a manifest listing the
+tasks it was responsible for; `eval.merge_shards` uses the manifests to
+check coverage and reassemble one ordered rollout file.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+MANIFEST_VERSION = "1.1"
+MANIFEST_SUFFIX = ".manifest.json"
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse 'i/N' into (index, count) with 0 <= i < N."""
+    try:
+        index_str, count_str = spec.split("/")
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{spec}'. Expected 'i/N', e.g. '0/4'.") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard '{spec}'. Need 0 <= i < N.")
+    return index, count
+
+
+def shard_of(task_id: str, num_shards: int) -> int:
+    digest = hashlib.sha256(task_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def select_shard(
+    problems: list[dict[str, Any]], index: int, count: int
+) -> list[tuple[int, dict[str, Any]]]:
+    """Return (dataset_position, problem) pairs belonging to shard `index` of `count`."""
+    return [
+        (pos, p) for pos, p in enumerate(problems) if shard_of(p["task_id"], count) == index
+    ]
+
+
+def task_list_digest(problems: list[dict[str, Any]]) -> str:
+    """sha256 of the ordered task_id list, so shards can prove they saw the same tasks."""
+    h = hashlib.sha256()
+    for p in problems:
+        h.update(p["task_id"].encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def manifest_path_for(output_path: Path) -> Path:
+    return output_path.with_suffix(MANIFEST_SUFFIX)
+
+
+def write_manifest(
+    output_path: Path,
+    *,
+    shard: tuple[int, int],
+    split: str,
+    limit: int | None,
+    n_samples: int,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    num_problems: int,
+    task_list_sha256: str,
+    task_positions: dict[str, int],
+    summary: dict[str, Any],
+) -> Path:
+    """Write the manifest describing one shard run next to its output file."""
+    index, count = shard
+    manifest = {
+        "_manifest_version": MANIFEST_VERSION,
+        "shard_index": index,
+        "shard_count": count,
+        "split": split,
+        "limit": limit,
+        "n_samples": n_samples,
+        "model": model,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "num_problems": num_problems,
+        "task_list_sha256": task_list_sha256,
+        "output_file": output_path.name,
+        "task_positions": task_positions,
+        "summary": summary,
+        "completed_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }
+    path = manifest_path_for(output_path)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return path
+
+
+def read_manifest(path: Path) -> dict[str, Any]:
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,180 @@
+"""Stage-level tracing for the eval pipeline.
+
+A `Tracer` records timed spans (inference, parsing, test execution, rollout
+writes), token counts and rollout throughput. It can drive a live rich
+progress display and dump a Chrome trace file (load it in chrome://tracing
+or https://ui.perfetto.dev).
+
+Every pipeline function takes an optional `tracer`; passing None uses a
+shared no-op tracer so un-instrumented callers pay nothing.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    TextColumn,
+    TimeElapsedColumn,
+)
+
+
+class Span:
+    """A single timed stage. `args` ends up in the trace event."""
+
+    __slots__ = ("name", "args", "start_ns", "end_ns", "tid")
+
+    def __init__(self, name: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.args = args
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        self.tid = threading.get_ident()
+
+    def set(self, **kwargs: Any) -> None:
+        self.args.update(kwargs)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+
+class Tracer:
+    """Collects spans and counters for one eval run."""
+
+    def __init__(self, *, live: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._spans: list[Span] = []
+        self._stage_ms: dict[str, float] = defaultdict(float)
+        self._stage_count: dict[str, int] = defaultdict(int)
+        self.counters: dict[str, int] = defaultdict(int)
+
+        self._live = live
+        self._progress: Progress | None = None
+        self._task_id: Any = None
+        self._progress_start_ns = self._origin_ns
+
+    # -- spans ---------------------------------------------------------------
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        s = Span(name, dict(args))
+        try:
+            yield s
+        finally:
+            s.end_ns = time.perf_counter_ns()
+            with self._lock:
+                self._spans.append(s)
+                self._stage_ms[name] += s.duration_ms
+                self._stage_count[name] += 1
+
+    def incr(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    # -- live progress -------------------------------------------------------
+
+    def start_progress(self, total: int) -> None:
+        """Begin the live display for `total` problems (no-op unless live)."""
+        if not self._live:
+            return
+        self._progress = Progress(
+            TextColumn("[bold blue]eval"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TimeElapsedColumn(),
+            TextColumn("{task.fields[rate]}"),
+        )
+        self._task_id = self._progress.add_task("eval", total=total, rate="")
+        # Rates exclude setup such as a first-time dataset download
+        self._progress_start_ns = time.perf_counter_ns()
+        self._progress.start()
+
+    def advance(self) -> None:
+        """Mark one problem as done and refresh throughput figures."""
+        if self._progress is None:
+            return
+        elapsed = max((time.perf_counter_ns() - self._progress_start_ns) / 1e9, 1e-9)
+        rate = (
+            f"{self.counters['rollouts'] / elapsed:.2f} rollouts/s  "
+            f"{self.counters['completion_tokens'] / elapsed:.0f} tok/s"
+        )
+        self._progress.update(self._task_id, advance=1, rate=rate)
+
+    def stop_progress(self) -> None:
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
+
+    # -- reporting -----------------------------------------------------------
+
+    def stage_summary(self) -> dict[str, dict[str, float]]:
+        """Return {stage: {"count", "total_ms", "mean_ms"}} ordered by total time."""
+        with self._lock:
+            rows = {
+                name: {
+                    "count": self._stage_count[name],
+                    "total_ms": total,
+                    "mean_ms": total / self._stage_count[name],
+                }
+                for name, total in self._stage_ms.items()
+            }
+        return dict(sorted(rows.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write all spans as Chrome trace "complete" (ph=X) events."""
+        pid = os.getpid()
+        with self._lock:
+            events = [
+                {
+                    "name": s.name,
+                    "cat": "eval",
+                    "ph": "X",
+                    "ts": (s.start_ns - self._origin_ns) / 1000,
+                    "dur": ((s.end_ns or s.start_ns) - s.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": s.tid,
+                    "args": s.args,
+                }
+                for s in self._spans
+            ]
+            counters = dict(self.counters)
+        trace = {"traceEvents": events, "displayTimeUnit": "ms", "otherData": counters}
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(trace, f)
+
+
+class _NullSpan(Span):
+    def __init__(self) -> None:
+        # Skip timing entirely
+        pass
+
+    def set(self, **kwargs: Any) -> None:
+        pass
+
+
+class _NullTracer(Tracer):
+    """Tracer that records nothing; used when the caller passes tracer=None."""
+
+    _span = _NullSpan()
+
+    @contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[Span]:
+        yield self._span
+
+    def incr(self, name: str, value: int = 1) -> None:
+        pass
+
+
+NULL_TRACER = _NullTracer()
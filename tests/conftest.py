@@ -0,0 +1,4 @@
+import os
+
+# Keep the viewer's background indexer from touching the real data dir
+os.environ.setdefault("SEARCH_SYNC_INTERVAL", "0")
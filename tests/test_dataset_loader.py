@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from eval.dataset_loader import _normalize
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ROW = {"prompt": "def f():", "test": "assert f() is None"}
+
+
+def _fallback_id_in_subprocess(hash_seed: str) -> str:
+    code = (
+        "from eval.dataset_loader import _normalize\n"
+        f"print(_normalize({ROW!r})['task_id'])\n"
+    )
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_fallback_task_id_is_stable_across_processes():
+    ids = {_fallback_id_in_subprocess(seed) for seed in ("1", "2", "12345")}
+    assert ids == {_normalize(ROW)["task_id"]}
+    assert next(iter(ids)).startswith("task_")
+
+
+def test_explicit_ids_take_precedence():
+    assert _normalize({**ROW, "task_id": "lcb/1"})["task_id"] == "lcb/1"
+    assert _normalize({**ROW, "id": 7})["task_id"] == "7"
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from eval.merge_shards import MergeError, merge_shards
+from eval.sharding import parse_shard, select_shard, shard_of, task_list_digest, write_manifest
+
+PROBLEMS = [{"task_id": f"t{i}"} for i in range(12)]
+
+
+def _rollout(task_id, sample_index, passed=True):
+    return {
+        "task_id": task_id,
+        "sample_index": sample_index,
+        "pass_original_test": passed,
+        "pass_impossible_test": False,
+    }
+
+
+def _write_shard(tmp_path, index, count, *, problems=PROBLEMS, n_samples=2, positions=None, skip=()):
+    """Write one shard's rollouts (minus `skip` keys) and manifest; return the manifest path."""
+    if positions is None:
+        positions = {p["task_id"]: pos for pos, p in select_shard(problems, index, count)}
+    out = tmp_path / f"run_shard{index}of{count}.jsonl"
+    with out.open("w", encoding="utf-8") as f:
+        for task_id in positions:
+            for i in range(n_samples):
+                if (task_id, i) not in skip:
+                    f.write(json.dumps(_rollout(task_id, i)) + "\n")
+    return write_manifest(
+        out,
+        shard=(index, count),
+        split="conflicting",
+        limit=None,
+        n_samples=n_samples,
+        model="m",
+        temperature=0.6,
+        max_tokens=100,
+        num_problems=len(problems),
+        task_list_sha256=task_list_digest(problems),
+        task_positions=positions,
+        summary={},
+    )
+
+
+def _read(path):
+    return [json.loads(line) for line in path.open(encoding="utf-8")]
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("4/4", "-1/4", "0/0", "1", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard(bad)
+
+
+def test_partition_is_complete():
+    count = 3
+    shards = [select_shard(PROBLEMS, i, count) for i in range(count)]
+    positions = sorted(pos for shard in shards for pos, _ in shard)
+    assert positions == list(range(len(PROBLEMS)))
+
+
+def test_shard_of_is_pinned():
+    # sha256-based, so identical on every host and Python process
+    assert [shard_of(f"t{i}", 4) for i in range(8)] == [0, 2, 0, 2, 1, 3, 3, 1]
+
+
+def test_merge_orders_by_dataset_position(tmp_path):
+    manifests = [_write_shard(tmp_path, i, 3) for i in range(3)]
+    out = tmp_path / "merged.jsonl"
+    summary = merge_shards(manifests, out)
+
+    keys = [(r["task_id"], r["sample_index"]) for r in _read(out)]
+    assert keys == [(p["task_id"], i) for p in PROBLEMS for i in range(2)]
+    assert summary["total"] == 24
+    assert summary["pass_original"] == 24
+    assert summary["missing"] == []
+
+
+def test_merge_rejects_missing_shard(tmp_path):
+    manifests = [_write_shard(tmp_path, i, 3) for i in range(2)]
+    with pytest.raises(MergeError, match="Missing shards"):
+        merge_shards(manifests, tmp_path / "merged.jsonl")
+
+
+def test_merge_rejects_missing_rollouts_unless_allowed(tmp_path):
+    victim = select_shard(PROBLEMS, 0, 2)[0][1]["task_id"]
+    manifests = [_write_shard(tmp_path, 0, 2, skip={(victim, 1)}), _write_shard(tmp_path, 1, 2)]
+    with pytest.raises(MergeError, match="1 rollouts missing"):
+        merge_shards(manifests, tmp_path / "merged.jsonl")
+
+    summary = merge_shards(manifests, tmp_path / "merged.jsonl", allow_missing=True)
+    assert summary["missing"] == [(victim, 1)]
+    assert summary["total"] == 23
+
+
+def test_merge_rejects_duplicate_rollouts(tmp_path):
+    manifests = [_write_shard(tmp_path, i, 2) for i in range(2)]
+    shard_file = tmp_path / "run_shard0of2.jsonl"
+    first_line = shard_file.read_text(encoding="utf-8").splitlines()[0]
+    with shard_file.open("a", encoding="utf-8") as f:
+        f.write(first_line + "\n")
+    with pytest.raises(MergeError, match="duplicate rollout"):
+        merge_shards(manifests, tmp_path / "merged.jsonl")
+
+
+def test_merge_rejects_different_task_lists(tmp_path):
+    other = [{"task_id": f"x{i}"} for i in range(12)]
+    manifests = [_write_shard(tmp_path, 0, 2), _write_shard(tmp_path, 1, 2, problems=other)]
+    with pytest.raises(MergeError, match="task_list_sha256"):
+        merge_shards(manifests, tmp_path / "merged.jsonl")
+
+
+def test_merge_rejects_uncovered_and_double_claimed_positions(tmp_path):
+    problems = [{"task_id": t} for t in ("A", "B", "C")]
+    manifests = [
+        _write_shard(tmp_path, 0, 2, problems=problems, positions={"A": 0}),
+        _write_shard(tmp_path, 1, 2, problems=problems, positions={"C": 0}),
+    ]
+    with pytest.raises(MergeError, match="position 0 claimed by both"):
+        merge_shards(manifests, tmp_path / "merged.jsonl")
+
+    manifests = [
+        _write_shard(tmp_path, 0, 2, problems=problems, positions={"A": 0}),
+        _write_shard(tmp_path, 1, 2, problems=problems, positions={"C": 2}),
+    ]
+    with pytest.raises(MergeError, match=r"unclaimed \[1\]"):
+        merge_shards(manifests, tmp_path / "merged.jsonl")
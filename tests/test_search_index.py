@@ -0,0 +1,180 @@
+import json
+import os
+
+import pytest
+
+from viewer.search_index import SearchIndex
+
+
+def _line(task_id, thinking, *, sample_index=0, split="conflicting", pass_impossible=False):
+    return json.dumps({
+        "task_id": task_id,
+        "sample_index": sample_index,
+        "split": split,
+        "original_thinking": thinking,
+        "original_answer": "def f(): return <b>1</b>",
+        "pass_original_test": True,
+        "pass_impossible_test": pass_impossible,
+    }) + "\n"
+
+
+@pytest.fixture
+def rollouts_dir(tmp_path):
+    d = tmp_path / "rollouts"
+    d.mkdir()
+    return d
+
+
+@pytest.fixture
+def index(tmp_path, rollouts_dir):
+    return SearchIndex(tmp_path / "index.sqlite3", rollouts_dir)
+
+
+def _hits(index, query, **filters):
+    index.sync()
+    return [(r["filename"], r["task_id"]) for r in index.search(query, **filters)]
+
+
+def test_indexes_new_file_with_escaped_snippet(index, rollouts_dir):
+    (rollouts_dir / "a.jsonl").write_text(_line("t0", "I will modify the test <here>"))
+    index.sync()
+    [hit] = index.search('"modify the test"')
+    assert hit["task_id"] == "t0"
+    assert str(hit["snippet"]) == "I will <mark>modify the test</mark> &lt;here&gt;"
+
+
+def test_append_and_partial_line(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    path.write_text(_line("t0", "alpha"))
+    assert _hits(index, "alpha") == [("a.jsonl", "t0")]
+
+    partial = _line("t1", "bravo")
+    with path.open("a") as f:
+        f.write(partial[:20])
+    assert _hits(index, "bravo") == []
+
+    with path.open("a") as f:
+        f.write(partial[20:])
+    assert _hits(index, "bravo") == [("a.jsonl", "t1")]
+    assert _hits(index, "alpha") == [("a.jsonl", "t0")]
+
+
+def test_same_size_rewrite_is_reindexed(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    path.write_text("".join(_line(f"t{i}", "alpha" if i == 0 else f"filler {i}") for i in range(100)))
+    assert _hits(index, "alpha") == [("a.jsonl", "t0")]
+
+    text = path.read_text()
+    st = path.stat()
+    path.write_text(text.replace("alpha", "bravo", 1))
+    # Coarse filesystem timestamps could otherwise leave mtime unchanged
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert path.stat().st_size == st.st_size
+    assert _hits(index, "alpha") == []
+    assert _hits(index, "bravo") == [("a.jsonl", "t0")]
+
+    with path.open("a") as f:
+        f.write(_line("t100", "charlie"))
+    assert _hits(index, "alpha") == []
+    assert _hits(index, "bravo") == [("a.jsonl", "t0")]
+    assert _hits(index, "charlie") == [("a.jsonl", "t100")]
+
+
+def test_atomic_rewrite_with_growth_is_reindexed(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    path.write_text("".join(_line(f"t{i}", "alpha" if i == 0 else f"filler {i}") for i in range(100)))
+    assert _hits(index, "alpha") == [("a.jsonl", "t0")]
+
+    # Edit an early line (outside the tail-digest window) and append in one step
+    tmp = rollouts_dir / "a.jsonl.tmp"
+    tmp.write_text(path.read_text().replace("alpha", "bravo", 1) + _line("t100", "charlie"))
+    os.replace(tmp, path)
+    assert _hits(index, "alpha") == []
+    assert _hits(index, "bravo") == [("a.jsonl", "t0")]
+    assert _hits(index, "charlie") == [("a.jsonl", "t100")]
+
+
+def test_shrunk_and_deleted_files(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    path.write_text(_line("t0", "alpha") + _line("t1", "bravo"))
+    assert len(_hits(index, "alpha OR bravo")) == 2
+
+    path.write_text(_line("t1", "bravo"))
+    assert _hits(index, "alpha") == []
+    assert _hits(index, "bravo") == [("a.jsonl", "t1")]
+
+    path.unlink()
+    assert _hits(index, "bravo") == []
+
+
+def test_update_rollout_targets_edited_duplicate(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    # A rerun appended a second rollout with the same key
+    path.write_text(_line("t0", "first run") + _line("t0", "second run"))
+    index.sync()
+
+    rollouts = [json.loads(line) for line in path.read_text().splitlines()]
+    rollouts[0]["edited_thinking"] = "zebra"
+    path.write_text("".join(json.dumps(r) + "\n" for r in rollouts))
+    index.update_rollout("a.jsonl", 0, rollouts[0], len(rollouts))
+
+    [hit] = index.search("zebra")
+    assert "first" not in str(hit["snippet"])
+    assert len(index.search("zebra OR first")) == 1
+    assert len(index.search("second")) == 1
+    # File state was re-stamped, so the next sync is a no-op that keeps the edit
+    assert len(_hits(index, "zebra")) == 1
+
+
+def test_update_rollout_with_stale_index_defers_to_sync(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    path.write_text(_line("t0", "alpha"))
+    index.sync()
+
+    rollouts = [json.loads(_line("t0", "alpha")), json.loads(_line("t1", "unsynced"))]
+    rollouts[0]["edited_thinking"] = "zebra"
+    path.write_text("".join(json.dumps(r) + "\n" for r in rollouts))
+    index.update_rollout("a.jsonl", 0, rollouts[0], len(rollouts))
+
+    assert _hits(index, "zebra") == [("a.jsonl", "t0")]
+    assert _hits(index, "unsynced") == [("a.jsonl", "t1")]
+
+
+def test_filters_and_phrase_fallback(index, rollouts_dir):
+    (rollouts_dir / "a.jsonl").write_text(
+        _line("t0", "special-case the input", split="conflicting", pass_impossible=True)
+        + _line("t1", "special-case nothing", split="one_off")
+    )
+    assert len(_hits(index, "special-case")) == 2
+    assert _hits(index, "special-case", split="one_off") == [("a.jsonl", "t1")]
+    assert _hits(index, "special-case", pass_impossible=True) == [("a.jsonl", "t0")]
+    assert _hits(index, "special-case", pass_impossible=False) == [("a.jsonl", "t1")]
+
+
+def test_stale_files_tracks_unsynced_changes(index, rollouts_dir):
+    path = rollouts_dir / "a.jsonl"
+    path.write_text(_line("t0", "alpha"))
+    assert index.stale_files() == ["a.jsonl"]
+    index.sync()
+    assert index.stale_files() == []
+    with path.open("a") as f:
+        f.write(_line("t1", "bravo"))
+    assert index.stale_files() == ["a.jsonl"]
+
+
+def test_search_route_does_not_index(monkeypatch, index, rollouts_dir):
+    import viewer.routes as routes
+    from viewer.app import create_app
+
+    monkeypatch.setattr(routes, "SEARCH_INDEX", index)
+    client = create_app().test_client()
+    (rollouts_dir / "a.jsonl").write_text(_line("t0", "alpha"))
+
+    page = client.get("/search?q=alpha").get_data(as_text=True)
+    assert "0 results" in page
+    assert "catching up on 1 file" in page
+
+    index.sync()
+    page = client.get("/search?q=alpha").get_data(as_text=True)
+    assert "1 results" in page
+    assert "catching up" not in page
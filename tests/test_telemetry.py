@@ -0,0 +1,139 @@
+import json
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from eval.executor import START_MARKER, evaluate_output, run_tests
+from eval.inference import run_inference
+from eval.telemetry import Tracer
+from viewer.metrics import Histogram
+
+
+def _stub_client(*contents, prompt_tokens=11, completion_tokens=42):
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=c)) for c in contents],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+    )
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **kw: response)))
+
+
+def test_histogram_render_is_cumulative_with_le_buckets():
+    h = Histogram("h_seconds", "Help text.", ("op",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        h.observe(value, "read")
+
+    lines = h.render()
+    assert lines[:2] == ["# HELP h_seconds Help text.", "# TYPE h_seconds histogram"]
+    # A value equal to a bound falls in that bound's bucket (le = "less or equal")
+    assert 'h_seconds_bucket{op="read",le="0.1"} 2' in lines
+    assert 'h_seconds_bucket{op="read",le="1.0"} 3' in lines
+    assert 'h_seconds_bucket{op="read",le="+Inf"} 4' in lines
+    assert 'h_seconds_sum{op="read"} 5.65' in lines
+    assert 'h_seconds_count{op="read"} 4' in lines
+
+
+def test_histogram_escapes_label_values():
+    h = Histogram("h", "Help.", ("endpoint",), buckets=(1.0,))
+    h.observe(0.5, 'a"b\\c\nd')
+    assert 'h_count{endpoint="a\\"b\\\\c\\nd"} 1' in h.render()
+
+
+def test_chrome_trace_records_inference_tokens(tmp_path):
+    tracer = Tracer()
+    outputs = run_inference("p", client=_stub_client("a", "b"), n=2, tracer=tracer)
+    assert outputs == ["<think>\na", "<think>\nb"]
+
+    path = tmp_path / "run.trace.json"
+    tracer.write_chrome_trace(path)
+    trace = json.loads(path.read_text())
+
+    [event] = trace["traceEvents"]
+    assert event["name"] == "run_inference"
+    assert event["ph"] == "X"
+    assert event["args"] == {"n": 2, "prompt_tokens": 11, "completion_tokens": 42}
+    # ts/dur are microseconds relative to tracer creation
+    assert event["ts"] >= 0
+    assert event["dur"] == pytest.approx(tracer._spans[0].duration_ms * 1000)
+    assert trace["otherData"] == {"prompt_tokens": 11, "completion_tokens": 42}
+
+
+def test_stage_summary_orders_by_total_time():
+    tracer = Tracer()
+    for _ in range(3):
+        with tracer.span("fast"):
+            pass
+    with tracer.span("slow"):
+        time.sleep(0.02)
+
+    summary = tracer.stage_summary()
+    assert list(summary) == ["slow", "fast"]
+    assert summary["fast"]["count"] == 3
+    assert summary["slow"]["mean_ms"] >= 20
+
+
+def test_run_tests_splits_startup_and_strips_marker():
+    ok = run_tests("from __future__ import annotations\ndef f() -> int: return 1", "assert f() == 1")
+    assert ok.passed
+    assert ok.startup_ms is not None and ok.test_ms is not None
+    assert ok.startup_ms + ok.test_ms <= ok.time_ms + 1
+
+    failed = run_tests("def f(): return 1", "assert f() == 2")
+    assert not failed.passed
+    assert START_MARKER not in failed.error
+    # Line numbers are those of the harness itself, with no prelude frame
+    assert failed.error.count('File "<string>"') == 1
+    assert "line 3" in failed.error
+
+
+def test_run_tests_span_records_timeout(monkeypatch):
+    import eval.executor as executor
+
+    real_run_tests = executor.run_tests
+    monkeypatch.setattr(executor, "run_tests", lambda code, harness: real_run_tests(code, harness, timeout=1))
+    tracer = Tracer()
+    evaluate_output("```python\nimport time\n```", "time.sleep(10)", "", tracer=tracer)
+    original = next(s for s in tracer._spans if s.args.get("suite") == "original")
+    assert original.args["timed_out"] is True
+    assert original.args["passed"] is False
+    assert original.args["startup_ms"] is not None
+
+
+def test_trace_written_when_run_fails(monkeypatch, tmp_path):
+    import eval.run_eval as run_eval
+
+    def failing_run(*args, tracer, **kwargs):
+        with tracer.span("load_problems"):
+            pass
+        raise KeyboardInterrupt
+
+    trace = tmp_path / "run.trace.json"
+    monkeypatch.setattr(run_eval, "run_evaluation", failing_run)
+    monkeypatch.setattr(
+        sys, "argv", ["run_eval", "--output", str(tmp_path / "run.jsonl"), "--trace", str(trace), "--no-progress"]
+    )
+    with pytest.raises(KeyboardInterrupt):
+        run_eval.main()
+
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert [e["name"] for e in events] == ["load_problems"]
+
+
+def test_metrics_endpoint_reports_requests_and_file_loads(monkeypatch, tmp_path):
+    import viewer.routes as routes
+    from viewer.app import create_app
+
+    monkeypatch.setattr(routes, "ROLLOUTS_DIR", tmp_path)
+    (tmp_path / "a.jsonl").write_text(json.dumps({"task_id": "t0", "sample_index": 0}) + "\n")
+    client = create_app().test_client()
+    assert client.get("/").status_code == 200
+    assert client.get("/rollouts/a.jsonl").status_code == 200
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/plain"
+    body = resp.get_data(as_text=True)
+    assert 'viewer_request_duration_seconds_count{endpoint="viewer.index",method="GET",status="200"}' in body
+    assert 'viewer_file_load_duration_seconds_count{operation="read"}' in body
+    assert 'viewer_file_load_duration_seconds_count{operation="list"}' in body
@@ -1,9 +1,16 @@
 """Flask app factory."""
 from __future__ import annotations
 
-from flask import Flask
+import threading
+import time
+
+from flask import Flask, g, request
 from flask_cors import CORS
 
+import config
+
+_indexer_started = False
+
 
 def create_app() -> Flask:
     app = Flask(__name__)
@@ -12,8 +19,55 @@ def create_app() -> Flask:
     from viewer.routes import bp
     app.register_blueprint(bp)
 
+    _install_request_metrics(app)
+
+    if config.SEARCH_SYNC_INTERVAL > 0:
+        _start_search_indexer(app, config.SEARCH_SYNC_INTERVAL)
+
     return app
 
 
+def _start_search_indexer(app: Flask, interval: float) -> None:
+    """Keep the search index current in a daemon thread, off the request path."""
+    global _indexer_started
+    if _indexer_started:
+        return
+    _indexer_started = True
+
+    from viewer.metrics import FILE_LOAD_TIME
+    from viewer.routes import SEARCH_INDEX
+
+    def _loop() -> None:
+        while True:
+            try:
+                with FILE_LOAD_TIME.time("index_sync"):
+                    SEARCH_INDEX.sync()
+            except Exception:
+                app.logger.exception("search index sync failed")
+            time.sleep(interval)
+
+    threading.Thread(target=_loop, name="search-indexer", daemon=True).start()
+
+
+def _install_request_metrics(app: Flask) -> None:
+    from viewer.metrics import REQUEST_LATENCY
+
+    @app.before_request
+    def _start_timer():
+        g._request_start = time.perf_counter()
+
+    @app.after_request
+    def _record_latency(response):
+        start = g.pop("_request_start", None)
+        if start is not None:
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - start,
+                request.endpoint or "unmatched",
+                request.method,
+                str(response.status_code),
+            )
+        return response
+
+
 # Allow `flask --app viewer.app run`
 app = create_app()
@@ -0,0 +1,94 @@
+"""Minimal Prometheus-style metrics for the viewer.
+
+Exposed as text exposition format on `/metrics`. Only histograms are needed
+(request latency per endpoint, JSONL load time per operation), so this is
+hand-rolled rather than pulling in prometheus_client.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# Seconds. Covers fast template renders up to multi-GB JSONL loads.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        # labels -> [bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(labels, [0] * (len(self.buckets) + 1))
+            counts[idx] += 1
+            self._sums[labels] = self._sums.get(labels, 0.0) + value
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items()]
+        for labels, counts, total in sorted(items):
+            base = [f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, labels)]
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lbl = ",".join(base + [f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{lbl}}} {cumulative}")
+            lbl = "{" + ",".join(base) + "}" if base else ""
+            lines.append(f"{self.name}_sum{lbl} {total}")
+            lines.append(f"{self.name}_count{lbl} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+REQUEST_LATENCY = Histogram(
+    "viewer_request_duration_seconds",
+    "HTTP request latency by endpoint, method and status.",
+    ("endpoint", "method", "status"),
+)
+
+FILE_LOAD_TIME = Histogram(
+    "viewer_file_load_duration_seconds",
+    "Time spent reading or rewriting rollout JSONL files.",
+    ("operation",),
+)
+
+REGISTRY = (REQUEST_LATENCY, FILE_LOAD_TIME)
+
+
+def render_all() -> str:
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
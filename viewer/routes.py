@@ -7,14 +7,18 @@ import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
-from flask import Blueprint, abort, jsonify, redirect, render_template, request, url_for
+from flask import Blueprint, Response, abort, jsonify, redirect, render_template, request, url_for
 
 import config
 from export.sft_exporter import export_file
+from viewer.metrics import FILE_LOAD_TIME, render_all
+from viewer.search_index import SearchIndex
 
 bp = Blueprint("viewer", __name__)
 
 ROLLOUTS_DIR = config.ROLLOUTS_DIR
+SEARCH_INDEX = SearchIndex(config.SEARCH_INDEX_PATH, ROLLOUTS_DIR)
+SEARCH_LIMIT = 100
 
 
 # ---------------------------------------------------------------------------
@@ -22,11 +26,12 @@ ROLLOUTS_DIR = config.ROLLOUTS_DIR
 # ---------------------------------------------------------------------------
 
 def _list_rollout_files() -> list[dict]:
-    files = sorted(ROLLOUTS_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
-    result = []
-    for f in files:
-        lines = sum(1 for _ in f.open(encoding="utf-8"))
-        result.append({"name": f.name, "lines": lines, "size_kb": round(f.stat().st_size / 1024, 1)})
+    with FILE_LOAD_TIME.time("list"):
+        files = sorted(ROLLOUTS_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)
+        result = []
+        for f in files:
+            lines = sum(1 for _ in f.open(encoding="utf-8"))
+            result.append({"name": f.name, "lines": lines, "size_kb": round(f.stat().st_size / 1024, 1)})
     return result
 
 
@@ -35,7 +40,7 @@ def _read_rollouts(filename: str) -> list[dict]:
     if not path.exists():
         abort(404)
     rollouts = []
-    with path.open(encoding="utf-8") as f:
+    with FILE_LOAD_TIME.time("read"), path.open(encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if line:
@@ -55,7 +60,7 @@ def _write_rollouts(filename: str, rollouts: list[dict]) -> None:
     path = ROLLOUTS_DIR / filename
     tmp_fd, tmp_path = tempfile.mkstemp(dir=ROLLOUTS_DIR, suffix=".tmp")
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+        with FILE_LOAD_TIME.time("write"), os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
             for r in rollouts:
                 f.write(json.dumps(r) + "\n")
         os.replace(tmp_path, path)
@@ -119,10 +124,54 @@ def edit_rollout(filename: str, task_id: str):
 
     rollouts[idx] = rollout
     _write_rollouts(filename, rollouts)
+    SEARCH_INDEX.update_rollout(filename, idx, rollout, len(rollouts))
 
     return jsonify({"status": "ok", "edited_at": rollout["edited_at"]})
 
 
+def _flag_arg(name: str) -> bool | None:
+    value = request.args.get(name, "")
+    if value == "":
+        return None
+    return value == "1"
+
+
+@bp.route("/search")
+def search():
+    """Full-text search over thinking/answer text across all rollout files."""
+    query = request.args.get("q", "").strip()
+    split = request.args.get("split") or None
+    pass_original = _flag_arg("pass_original")
+    pass_impossible = _flag_arg("pass_impossible")
+
+    results = []
+    truncated = False
+    stale_files = []
+    if query:
+        # Indexing happens in the background; only query what is there now
+        stale_files = SEARCH_INDEX.stale_files()
+        # Fetch one extra row to know whether the list was cut off
+        results = SEARCH_INDEX.search(
+            query,
+            split=split,
+            pass_original=pass_original,
+            pass_impossible=pass_impossible,
+            limit=SEARCH_LIMIT + 1,
+        )
+        truncated = len(results) > SEARCH_LIMIT
+        results = results[:SEARCH_LIMIT]
+    return render_template(
+        "search.html",
+        query=query,
+        split=split or "",
+        pass_original=request.args.get("pass_original", ""),
+        pass_impossible=request.args.get("pass_impossible", ""),
+        results=results,
+        truncated=truncated,
+        stale_files=stale_files,
+    )
+
+
 @bp.route("/rollouts/<filename>/export")
 def export_rollouts(filename: str):
     """Download SFT JSONL for a rollout file."""
@@ -130,12 +179,18 @@ def export_rollouts(filename: str):
     if not path.exists():
         abort(404)
 
-    lines = export_file(path)
+    with FILE_LOAD_TIME.time("export"):
+        lines = export_file(path)
     content = "\n".join(json.dumps(r) for r in lines) + "\n"
 
-    from flask import Response
     return Response(
         content,
         mimetype="application/x-ndjson",
         headers={"Content-Disposition": f"attachment; filename=sft_{filename}"},
     )
+
+
+@bp.route("/metrics")
+def metrics():
+    """Prometheus text exposition of request latencies and file load times."""
+    return Response(render_all(), mimetype="text/plain; version=0.0.4")
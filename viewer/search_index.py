@@ -0,0 +1,315 @@
+"""Incremental SQLite FTS5 index over rollout reasoning traces.
+
+Indexes original/edited thinking and answer text for every JSONL file in
+ROLLOUTS_DIR. `sync()` runs off the request path (a background thread
+started by the app factory) and is cheap when nothing changed (one stat per
+file); `search()` only queries what is already indexed, and `stale_files()`
+reports which files the index is still behind on:
+
+  - new file                          → index it
+  - same inode, grew, tail before old
+    offset unchanged                  → index only the appended complete lines
+  - new inode, same size with new
+    mtime, shrank, or tail before old
+    offset changed                    → drop and reindex that file
+  - file deleted                      → drop its rows
+
+Appends never change a file's inode, while atomic rewrites (tmp file +
+`os.replace`, as the viewer's own `_write_rollouts` does) always do, so any
+such rewrite is reindexed regardless of what it changed. The tail digest
+(last few KB before the indexed offset) is a backstop for editors that
+rewrite in place: it cannot see an in-place edit earlier than that window
+that coincides with growth. Edits made through the viewer update their row
+directly via `update_rollout()`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from markupsafe import Markup, escape
+
+TEXT_FIELDS = ("original_thinking", "original_answer", "edited_thinking", "edited_answer")
+
+# Bytes before the indexed offset hashed to detect in-place rewrites
+_TAIL_BYTES = 4096
+_BATCH_ROWS = 500
+
+# Private-use sentinels so snippet highlighting survives HTML escaping
+_HL_START = "\ue000"
+_HL_END = "\ue001"
+
+# Bump when the schema changes; the index is a cache and is rebuilt from scratch
+_SCHEMA_VERSION = 2
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    indexed_bytes INTEGER NOT NULL,
+    tail_digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    filename TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    sample_index INTEGER,
+    split TEXT,
+    pass_original INTEGER,
+    pass_impossible INTEGER
+);
+CREATE INDEX IF NOT EXISTS docs_key ON docs (filename, task_id, sample_index);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5({", ".join(TEXT_FIELDS)});
+"""
+
+
+class SearchIndex:
+    def __init__(self, db_path: Path, rollouts_dir: Path) -> None:
+        self.db_path = db_path
+        self.rollouts_dir = rollouts_dir
+        # Serialises writers; SQLite handles concurrent readers itself
+        self._lock = threading.Lock()
+        self._initialised = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        if not self._initialised:
+            conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS docs; DROP TABLE IF EXISTS docs_fts;"
+                )
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._initialised = True
+        return conn
+
+    # -----------------------------------------------------------------------
+    # Indexing
+    # -----------------------------------------------------------------------
+
+    def sync(self) -> None:
+        """Bring the index up to date with the JSONL files on disk."""
+        with self._lock, closing(self._connect()) as conn:
+            known = {row["name"]: row for row in conn.execute("SELECT * FROM files")}
+            on_disk = {p.name: p for p in self.rollouts_dir.glob("*.jsonl")}
+
+            for name in known.keys() - on_disk.keys():
+                self._drop_file(conn, name)
+                conn.commit()
+
+            for name, path in on_disk.items():
+                st = path.stat()
+                state = known.get(name)
+                if _is_current(state, st):
+                    continue
+                start = 0
+                # Only genuine growth of the same inode can be an append; a new
+                # inode means an atomic rewrite, same size with a new mtime an
+                # in-place one
+                if (
+                    state is not None
+                    and state["inode"] == st.st_ino
+                    and st.st_size > state["indexed_bytes"]
+                    and _tail_digest(path, state["indexed_bytes"]) == state["tail_digest"]
+                ):
+                    start = state["indexed_bytes"]
+                else:
+                    self._drop_file(conn, name)
+                self._index_from(conn, path, start, st)
+
+    def stale_files(self) -> list[str]:
+        """Names of JSONL files whose on-disk state is ahead of the index."""
+        with closing(self._connect()) as conn:
+            known = {row["name"]: row for row in conn.execute("SELECT * FROM files")}
+        stale = []
+        for path in sorted(self.rollouts_dir.glob("*.jsonl")):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            if not _is_current(known.get(path.name), st):
+                stale.append(path.name)
+        return stale
+
+    def update_rollout(self, filename: str, idx: int, rollout: dict[str, Any], total: int) -> None:
+        """Refresh one rollout after an in-viewer edit and re-stamp the file.
+
+        The file was rewritten atomically, so its offsets changed but only
+        this row's content did; the stored file state is replaced rather than
+        triggering a full reindex on the next `sync()`. `idx` is the edited
+        rollout's position in the file, used to pick the right row when a
+        rerun appended duplicate (task_id, sample_index) keys. `total` is the
+        number of rollouts in the rewritten file: if the index holds a
+        different count it was stale, and the file is left for `sync()` to
+        reindex.
+        """
+        path = self.rollouts_dir / filename
+        with self._lock, closing(self._connect()) as conn:
+            (indexed,) = conn.execute("SELECT COUNT(*) FROM docs WHERE filename = ?", (filename,)).fetchone()
+            if indexed != total:
+                self._drop_file(conn, filename)
+                conn.commit()
+                return
+            # Rows are inserted in file order, so the idx-th id is the edited line
+            (doc_id,) = conn.execute(
+                "SELECT id FROM docs WHERE filename = ? ORDER BY id LIMIT 1 OFFSET ?",
+                (filename, idx),
+            ).fetchone()
+            conn.execute(
+                f"UPDATE docs_fts SET {', '.join(f'{f} = ?' for f in TEXT_FIELDS)} WHERE rowid = ?",
+                (*(rollout.get(f) or "" for f in TEXT_FIELDS), doc_id),
+            )
+            st = path.stat()
+            conn.execute(
+                "UPDATE files SET inode = ?, size = ?, mtime_ns = ?, indexed_bytes = ?, tail_digest = ? "
+                "WHERE name = ?",
+                (st.st_ino, st.st_size, st.st_mtime_ns, st.st_size, _tail_digest(path, st.st_size), filename),
+            )
+            conn.commit()
+
+    def _drop_file(self, conn: sqlite3.Connection, name: str) -> None:
+        conn.execute("DELETE FROM docs_fts WHERE rowid IN (SELECT id FROM docs WHERE filename = ?)", (name,))
+        conn.execute("DELETE FROM docs WHERE filename = ?", (name,))
+        conn.execute("DELETE FROM files WHERE name = ?", (name,))
+
+    def _index_from(self, conn: sqlite3.Connection, path: Path, start: int, st: os.stat_result) -> None:
+        """Index complete lines from byte offset `start`, committing in batches."""
+        offset = start
+        pending = 0
+        with path.open("rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # Partially written line from a running eval; pick up next sync
+                    break
+                offset += len(raw)
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    r = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._insert(conn, path.name, r)
+                pending += 1
+                if pending >= _BATCH_ROWS:
+                    self._save_state(conn, path, offset, st)
+                    conn.commit()
+                    pending = 0
+        self._save_state(conn, path, offset, st)
+        conn.commit()
+
+    def _insert(self, conn: sqlite3.Connection, filename: str, r: dict[str, Any]) -> None:
+        cur = conn.execute(
+            "INSERT INTO docs (filename, task_id, sample_index, split, pass_original, pass_impossible) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                filename,
+                r.get("task_id"),
+                r.get("sample_index"),
+                r.get("split"),
+                int(bool(r.get("pass_original_test"))),
+                int(bool(r.get("pass_impossible_test"))),
+            ),
+        )
+        conn.execute(
+            f"INSERT INTO docs_fts (rowid, {', '.join(TEXT_FIELDS)}) VALUES (?, ?, ?, ?, ?)",
+            (cur.lastrowid, *(r.get(f) or "" for f in TEXT_FIELDS)),
+        )
+
+    def _save_state(self, conn: sqlite3.Connection, path: Path, offset: int, st: os.stat_result) -> None:
+        # size is stored as the indexed offset while a partial tail line remains,
+        # so the next sync() revisits the file
+        conn.execute(
+            "INSERT OR REPLACE INTO files (name, inode, size, mtime_ns, indexed_bytes, tail_digest) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (path.name, st.st_ino, offset, st.st_mtime_ns, offset, _tail_digest(path, offset)),
+        )
+
+    # -----------------------------------------------------------------------
+    # Querying
+    # -----------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        *,
+        split: str | None = None,
+        pass_original: bool | None = None,
+        pass_impossible: bool | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Return ranked matches with an HTML-safe highlighted snippet.
+
+        `query` uses FTS5 syntax ("modify the test", hardcod*, a NOT b). If it
+        does not parse (e.g. a bare `special-case`), it is retried as a phrase.
+        """
+        where = ["docs_fts MATCH ?"]
+        params: list[Any] = []
+        if split:
+            where.append("d.split = ?")
+            params.append(split)
+        if pass_original is not None:
+            where.append("d.pass_original = ?")
+            params.append(int(pass_original))
+        if pass_impossible is not None:
+            where.append("d.pass_impossible = ?")
+            params.append(int(pass_impossible))
+
+        sql = (
+            "SELECT d.filename, d.task_id, d.sample_index, d.split, d.pass_original, d.pass_impossible, "
+            f"snippet(docs_fts, -1, '{_HL_START}', '{_HL_END}', '…', 24) AS snippet "
+            "FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid "
+            f"WHERE {' AND '.join(where)} ORDER BY rank LIMIT ?"
+        )
+        with closing(self._connect()) as conn:
+            try:
+                rows = conn.execute(sql, (query, *params, limit)).fetchall()
+            except sqlite3.OperationalError:
+                phrase = '"' + query.replace('"', '""') + '"'
+                rows = conn.execute(sql, (phrase, *params, limit)).fetchall()
+
+        return [
+            {
+                "filename": row["filename"],
+                "task_id": row["task_id"],
+                "sample_index": row["sample_index"],
+                "split": row["split"],
+                "pass_original_test": bool(row["pass_original"]),
+                "pass_impossible_test": bool(row["pass_impossible"]),
+                "snippet": _highlight(row["snippet"]),
+            }
+            for row in rows
+        ]
+
+
+def _is_current(state: sqlite3.Row | None, st: os.stat_result) -> bool:
+    return (
+        state is not None
+        and state["inode"] == st.st_ino
+        and state["size"] == st.st_size
+        and state["mtime_ns"] == st.st_mtime_ns
+    )
+
+
+def _tail_digest(path: Path, end: int) -> str:
+    start = max(0, end - _TAIL_BYTES)
+    with path.open("rb") as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(end - start)).hexdigest()
+
+
+def _highlight(snippet: str) -> Markup:
+    escaped = str(escape(snippet))
+    return Markup(escaped.replace(_HL_START, "<mark>").replace(_HL_END, "</mark>"))